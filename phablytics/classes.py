@@ -16,6 +16,11 @@ DATE_FORMAT = '%Y-%m-%d'
 
 
 class PhabricatorEntity:
+    # Entities are thin wrappers around Conduit results and can number in
+    # the thousands, so avoid a per-instance __dict__.
+    # Subclasses must declare __slots__ too, or they get a __dict__ back.
+    __slots__ = ('raw_data',)
+
     def __init__(self, raw_data):
         self.raw_data = raw_data
 
@@ -114,6 +119,8 @@ class PhabricatorEntity:
 
 
 class Maniphest(PhabricatorEntity):
+    __slots__ = ()
+
     def __str__(self):
         value = f'**[{self.task_id}]({self.url})** {self.name} *({self.status_value}, {self.points} pts)*'
         return value
@@ -151,6 +158,8 @@ class Maniphest(PhabricatorEntity):
 
 
 class Project(PhabricatorEntity):
+    __slots__ = ()
+
     @property
     def attachments(self):
         attachments = self.raw_data.get('attachments', {})
@@ -168,10 +177,12 @@ class Project(PhabricatorEntity):
 
 
 class ProjectColumn(PhabricatorEntity):
-    pass
+    __slots__ = ()
 
 
 class Repo(PhabricatorEntity):
+    __slots__ = ()
+
     ##
     # Primary attributes
 
@@ -200,6 +211,8 @@ class Repo(PhabricatorEntity):
 
 
 class Revision(PhabricatorEntity):
+    __slots__ = ()
+
     ##
     # Primary attributes
 
@@ -383,6 +396,8 @@ class Revision(PhabricatorEntity):
 
 
 class User(PhabricatorEntity):
+    __slots__ = ()
+
     def as_group(self):
         """Sometimes, Users are actually Groups, so convert to a Group
         when this is detected
@@ -437,6 +452,8 @@ class User(PhabricatorEntity):
 
 
 class Group(PhabricatorEntity):
+    __slots__ = ('group_data',)
+
     def __init__(self, raw_data, group_data=None, *args, **kwargs):
         super(Group, self).__init__(raw_data, *args, **kwargs)
 
@@ -9,7 +9,7 @@ from htk import slack_message
 from .reports.utils import (
     get_report_config,
     get_report_names,
-    get_report_types,
+    split_slack_message,
 )
 from .utils import (
     adhoc,
@@ -20,7 +20,20 @@ from .utils import (
 class PhablyticsCLI:
     def __init__(self):
         self.report_names = get_report_names()
-        self.report_types = get_report_types()
+        self._report_types = None
+
+    @property
+    def report_types(self):
+        """Mapping of report types to classes
+
+        Only built when a report is actually run, so that other commands
+        skip importing all of the reports.
+        """
+        if self._report_types is None:
+            # Local Imports
+            from .reports.utils import get_report_types
+            self._report_types = get_report_types()
+        return self._report_types
 
     def execute(self):
         self.parse_args()
@@ -40,13 +53,14 @@ class PhablyticsCLI:
                 report = report_class(report_config).generate_report()
                 if report_config.slack:
                     slack_channel = report_config.slack_channel
-                    slack_message(
-                        text=report.text,
-                        attachments=report.attachments,
-                        channel=slack_channel,
-                        username=report.username,
-                        icon_emoji=report.emoji
-                    )
+                    for message in split_slack_message(report):
+                        slack_message(
+                            text=message.text,
+                            attachments=message.attachments,
+                            channel=slack_channel,
+                            username=message.username,
+                            icon_emoji=message.emoji
+                        )
                 else:
                     print(report)
             else:
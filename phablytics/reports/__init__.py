@@ -1,7 +1,42 @@
-# Phablytics Imports
-from phablytics.reports.group_review_status import GroupReviewStatusReport
-from phablytics.reports.new_project_tasks import NewProjectTasksReport
-from phablytics.reports.recent_tasks import RecentTasksReport
-from phablytics.reports.revision_status import RevisionStatusReport
-from phablytics.reports.upcoming_tasks_due import UpcomingProjectTasksDueReport
-from phablytics.reports.urgent_and_overdue_project_tasks import UrgentAndOverdueProjectTasksReport
+# Python Standard Library Imports
+import importlib
+import sys
+
+
+# mapping of report types to the modules defining them
+# the report class for a report type is always named `<report_type>Report`
+REPORT_TYPE_MODULES = {
+    'GroupReviewStatus': 'group_review_status',
+    'NewProjectTasks': 'new_project_tasks',
+    'RecentTasks': 'recent_tasks',
+    'RevisionStatus': 'revision_status',
+    'UpcomingProjectTasksDue': 'upcoming_tasks_due',
+    'UrgentAndOverdueProjectTasks': 'urgent_and_overdue_project_tasks',
+}
+
+REPORT_TYPE_NAMES = tuple(REPORT_TYPE_MODULES.keys())
+
+
+def __getattr__(name):
+    """Lazily imports report classes and `REPORT_TYPES` on first access
+
+    Report modules pull in most of Phablytics, so they are not imported
+    until a report class is actually needed. Resolved values are stored
+    as module globals, so this only runs once per name.
+    """
+    if name == 'REPORT_TYPES':
+        # mapping of report types to classes
+        value = {
+            report_type: getattr(sys.modules[__name__], f'{report_type}Report')
+            for report_type
+            in REPORT_TYPE_NAMES
+        }
+    elif name.endswith('Report') and name[:-len('Report')] in REPORT_TYPE_MODULES:
+        module_name = REPORT_TYPE_MODULES[name[:-len('Report')]]
+        module = importlib.import_module(f'{__name__}.{module_name}')
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
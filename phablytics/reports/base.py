@@ -74,7 +74,7 @@ class PhablyticsReport:
             report.append(attachment['text'])
             count += 1
 
-        report_string = '\n'.join(report).encode('utf-8').decode('utf-8',)
+        report_string = '\n'.join(report)
 
         return report_string
 
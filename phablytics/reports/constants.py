@@ -1 +1,4 @@
 HTML_ICON_SEPARATOR = '&nbsp;' * 2
+
+# keep each posted Slack message comfortably under Slack's limits
+SLACK_MESSAGE_MAX_LENGTH = 4000
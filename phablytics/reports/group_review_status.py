@@ -66,7 +66,11 @@ class GroupReviewStatusReport(PhablyticsReport):
 
         non_group_reviewer_acceptance_threshold = self.non_group_reviewer_acceptance_threshold
 
-        date_created = (datetime.datetime.now() - datetime.timedelta(days=self.threshold_days)).replace(hour=0, minute=0, second=0)
+        # midnight (including microseconds) `threshold_days` ago
+        date_created = datetime.datetime.combine(
+            datetime.date.today() - datetime.timedelta(days=self.threshold_days),
+            datetime.time.min
+        )
         active_revisions = fetch_differential_revisions(
             reviewer_phids=reviewer_phids,
             modified_after_dt=date_created
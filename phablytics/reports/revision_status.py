@@ -1,6 +1,8 @@
 # Python Standard Library Imports
 import datetime
 import random
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 # Third Party (PyPI) Imports
 import emoji
@@ -26,48 +28,73 @@ class RevisionStatusReport(PhablyticsReport):
     and outputs them based on their acceptance/needs review status
     """
     def __init__(self, *args, **kwargs):
-        self.repo_phids = []
-        self.user_phids = []
+        self.repo_phids = set()
+        self.user_phids = set()
 
         self.repos_lookup = None
         self.users_lookup = None
+        self.user_names_lookup = None
 
-        super(RevisionStatusReport, self).__init__(*args, **kwargs)
-
-    def _add_users(self, phids):
-        self.user_phids.extend(phids)
+        # (phid, slack) -> formatted user link
+        self.formatted_users_lookup = {}
 
-    def _add_repo(self, phid):
-        self.repo_phids.append(phid)
+        super(RevisionStatusReport, self).__init__(*args, **kwargs)
 
     def _lookup_phids(self):
         """Build lookup tables for User and Repo phids in batch
+
+        The User and Repo lookups are independent Conduit calls, so they
+        are issued concurrently rather than one after the other.
         """
-        self.users_lookup = get_users_by_phid(self.user_phids)
-        self.repos_lookup = get_repos_by_phid(self.repo_phids)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            users_future = executor.submit(get_users_by_phid, list(self.user_phids))
+            repos_future = executor.submit(get_repos_by_phid, list(self.repo_phids))
+
+            self.users_lookup = users_future.result()
+            self.repos_lookup = repos_future.result()
+
+        self.user_names_lookup = {
+            phid: user.name
+            for phid, user
+            in self.users_lookup.items()
+        }
 
     def _prepare_report(self):
         """Prepares the Revision Status Report
         """
         # get revisions
-        date_created = (datetime.datetime.now() - datetime.timedelta(days=self.threshold_days)).replace(hour=0, minute=0, second=0)
+        # midnight (including microseconds) `threshold_days` ago
+        date_created = datetime.datetime.combine(
+            datetime.date.today() - datetime.timedelta(days=self.threshold_days),
+            datetime.time.min
+        )
         active_revisions = fetch_differential_revisions(
             self.query_key,
             modified_after_dt=date_created
         )
 
+        # sort once, newest first; bucketing below preserves this order
+        # ties are broken by revision id, so that reversing a bucket
+        # (see accepted revisions below) gives a well-defined order
+        active_revisions = sorted(active_revisions, key=attrgetter('modified_ts', 'id_'), reverse=True)
+
         # place revisions into buckets
         revisions_to_review = []
         revisions_with_blocks = []
         revisions_additional_approval = []
         revisions_accepted = []
 
+        # bind methods used for every revision to locals
+        add_user = self.user_phids.add
+        add_users = self.user_phids.update
+        add_repo = self.repo_phids.add
+
         for revision in active_revisions:
             if revision.meets_acceptance_criteria:
                 revisions_accepted.append(revision)
             elif revision.is_wip:
-                # skip WIP
-                pass
+                # skip WIP, and don't bother looking up its users and repo
+                continue
             elif revision.num_blockers > 0:
                 revisions_with_blocks.append(revision)
             elif 0 < revision.num_acceptors < REVISION_ACCEPTANCE_THRESHOLD:
@@ -76,10 +103,9 @@ class RevisionStatusReport(PhablyticsReport):
                 # no approvers
                 revisions_to_review.append(revision)
 
-            self._add_users(revision.reviewer_phids)
-            self._add_users([revision.author_phid])
-
-            self._add_repo(revision.repo_phid)
+            add_users(revision.reviewer_phids)
+            add_user(revision.author_phid)
+            add_repo(revision.repo_phid)
 
         # generate lookup tables after iterating through revisions
         self._lookup_phids()
@@ -95,7 +121,7 @@ class RevisionStatusReport(PhablyticsReport):
                     revision.blocker_phids
                 )
             )
-            if len(team_blockers) > 0:
+            if team_blockers:
                 revisions_change_required.append(revision)
             else:
                 revisions_blocked.append(revision)
@@ -105,18 +131,28 @@ class RevisionStatusReport(PhablyticsReport):
         self.revisions_change_required = revisions_change_required
         self.revisions_blocked = revisions_blocked
         self.revisions_additional_approval = revisions_additional_approval
-        self.revisions_accepted = revisions_accepted
+        # accepted revisions are listed oldest first
+        self.revisions_accepted = revisions_accepted[::-1]
 
     def _get_phid_username(self, phid):
-        user = self.users_lookup[phid]
-        return user.name
+        return self.user_names_lookup[phid]
 
     def _format_user_phid(self, phid, slack=True):
-        user = self.users_lookup[phid]
-        if slack:
-            formatted = f'*<{user.profile_url}|{user.name}>*'
-        else:
-            formatted = f'**[{user.name}]({user.profile_url})**'
+        """Formats a link to a user's profile
+
+        The same users show up across many revisions, so each link is only
+        formatted once per output format.
+        """
+        key = (phid, slack)
+        formatted = self.formatted_users_lookup.get(key)
+        if formatted is None:
+            name = self.user_names_lookup[phid]
+            profile_url = self.users_lookup[phid].profile_url
+            if slack:
+                formatted = f'*<{profile_url}|{name}>*'
+            else:
+                formatted = f'**[{name}]({profile_url})**'
+            self.formatted_users_lookup[key] = formatted
         return formatted
 
     def _format_and_append_revision_to_report(self, report, revision, count, slack=True):
@@ -126,8 +162,8 @@ class RevisionStatusReport(PhablyticsReport):
         else:
             repo_link = f'[{repo.slug}]({repo.repository_url})'
 
-        acceptors = [f'{self._format_user_phid(phid, slack=slack)}' for phid in revision.acceptor_phids]
-        blockers = [f'{self._format_user_phid(phid, slack=slack)}' for phid in revision.blocker_phids]
+        acceptors = [self._format_user_phid(phid, slack=slack) for phid in revision.acceptor_phids]
+        blockers = [self._format_user_phid(phid, slack=slack) for phid in revision.blocker_phids]
 
         MAX_LENGTH = 50
         revision_title = revision.title if len(revision.title) < MAX_LENGTH else (revision.title[:MAX_LENGTH - 3] + '...')
@@ -140,7 +176,7 @@ class RevisionStatusReport(PhablyticsReport):
 
         reviewers_msg = []
 
-        if len(acceptors) > 0:
+        if acceptors:
             icon = ':heavy_check_mark:'
             icon_separator = ' ' if slack else HTML_ICON_SEPARATOR
 
@@ -149,11 +185,9 @@ class RevisionStatusReport(PhablyticsReport):
 
             reviewers_msg.append(f"{icon}{icon_separator}{', '.join(acceptors)}")
 
-        if len(blockers) > 0:
-            if len(reviewers_msg) > 0:
+        if blockers:
+            if reviewers_msg:
                 reviewers_msg.append('; ')
-            else:
-                pass
 
             icon = ':no_entry_sign:'
             icon_separator = ' ' if slack else HTML_ICON_SEPARATOR
@@ -163,7 +197,7 @@ class RevisionStatusReport(PhablyticsReport):
 
             reviewers_msg.append(f"{icon}{icon_separator}{', '.join(blockers)}")
 
-        if len(reviewers_msg) > 0:
+        if reviewers_msg:
             separator = (' ' * 4) if slack else ('&nbsp;' * 4)
             report.append(f"{separator}{''.join(reviewers_msg)}")
 
@@ -178,15 +212,13 @@ class RevisionStatusReport(PhablyticsReport):
         num_revisions = len(self.revisions_to_review)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_to_review, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_to_review, start=1):
                 self._format_and_append_revision_to_report(report, revision, count)
 
             attachments.append({
                 'pretext': f":warning: *{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('need', num_revisions)} to be reviewed*: _(newest first)_",
-                'text': '\n'.join(report).encode('utf-8').decode('utf-8'),
+                'text': '\n'.join(report),
                 # 'color': 'warning',  # Slack-yellow, has an orange hue
                 'color': '#f2c744',
             })
@@ -195,15 +227,13 @@ class RevisionStatusReport(PhablyticsReport):
         num_revisions = len(self.revisions_change_required)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_change_required, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_change_required, start=1):
                 self._format_and_append_revision_to_report(report, revision, count)
 
             attachments.append({
                 'pretext': f":arrows_counterclockwise: *{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('require', num_revisions)} changes*: _(newest first)_",
-                'text': '\n'.join(report).encode('utf-8').decode('utf-8'),
+                'text': '\n'.join(report),
                 'color': '#e8912d',  # orange
             })
 
@@ -211,15 +241,13 @@ class RevisionStatusReport(PhablyticsReport):
         num_revisions = len(self.revisions_blocked)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_blocked, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_blocked, start=1):
                 self._format_and_append_revision_to_report(report, revision, count)
 
             attachments.append({
                 'pretext': f":no_entry_sign: *{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('is', num_revisions)} blocked*: _(newest first)_",
-                'text': '\n'.join(report).encode('utf-8').decode('utf-8'),
+                'text': '\n'.join(report),
                 'color': 'danger',
             })
 
@@ -227,15 +255,13 @@ class RevisionStatusReport(PhablyticsReport):
         num_revisions = len(self.revisions_additional_approval)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_additional_approval, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_additional_approval, start=1):
                 self._format_and_append_revision_to_report(report, revision, count)
 
             attachments.append({
                 'pretext': f":pray: *{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('need', num_revisions)} additional approvals*: _(newest first)_",
-                'text': '\n'.join(report).encode('utf-8').decode('utf-8'),
+                'text': '\n'.join(report),
                 'color': '#439fe0',  # blue
             })
 
@@ -243,15 +269,13 @@ class RevisionStatusReport(PhablyticsReport):
         num_revisions = len(self.revisions_accepted)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_accepted, key=lambda r: r.modified_ts):
-                count += 1
+            for count, revision in enumerate(self.revisions_accepted, start=1):
                 self._format_and_append_revision_to_report(report, revision, count)
 
             attachments.append({
                 'pretext': f":white_check_mark: *{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('is', num_revisions)} accepted and ready to land*: _(oldest first)_",
-                'text': '\n'.join(report).encode('utf-8').decode('utf-8'),
+                'text': '\n'.join(report),
                 'color': 'good',
             })
 
@@ -269,9 +293,9 @@ class RevisionStatusReport(PhablyticsReport):
         web_url = self.web_url
 
         context = {
-            'here': '<!here> ' if len(attachments) > 0 else '',
+            'here': '<!here> ' if attachments else '',
             'greeting': 'Greetings!',
-            'message': random.choice(DIFF_PRESENT_MESSAGES) if len(attachments) > 0 else random.choice(DIFF_ABSENT_MESSAGES),
+            'message': random.choice(DIFF_PRESENT_MESSAGES) if attachments else random.choice(DIFF_ABSENT_MESSAGES),
             'web_link': f'\n<{web_url}|View in web>' if web_url else '',
         }
 
@@ -292,76 +316,66 @@ class RevisionStatusReport(PhablyticsReport):
         num_revisions = len(self.revisions_to_review)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_to_review, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_to_review, start=1):
                 self._format_and_append_revision_to_report(report, revision, count, slack=False)
 
             icon = emoji.emojize(':warning:')
             lines.append(f"{icon}{HTML_ICON_SEPARATOR}**{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('need', num_revisions)} to be reviewed**: *(newest first)*")
             lines.append('')
-            lines.append('\n'.join(report).encode('utf-8').decode('utf-8'))
+            lines.append('\n'.join(report))
 
         # Revisions with team blockers - change required
         num_revisions = len(self.revisions_change_required)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_change_required, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_change_required, start=1):
                 self._format_and_append_revision_to_report(report, revision, count, slack=False)
 
             icon = emoji.emojize(':arrows_counterclockwise:', use_aliases=True)
             lines.append(f"{icon}{HTML_ICON_SEPARATOR}**{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('require', num_revisions)} changes**: *(newest first)*")
             lines.append('')
-            lines.append('\n'.join(report).encode('utf-8').decode('utf-8'))
+            lines.append('\n'.join(report))
 
         # Revisions with only external blockers
         num_revisions = len(self.revisions_blocked)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_blocked, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_blocked, start=1):
                 self._format_and_append_revision_to_report(report, revision, count, slack=False)
 
             icon = emoji.emojize(':no_entry_sign:', use_aliases=True)
             lines.append(f"{icon}{HTML_ICON_SEPARATOR}**{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('is', num_revisions)} blocked**: *(newest first)*")
             lines.append('')
-            lines.append('\n'.join(report).encode('utf-8').decode('utf-8'))
+            lines.append('\n'.join(report))
 
         # Revisions with 1 approval
         num_revisions = len(self.revisions_additional_approval)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_additional_approval, key=lambda r: r.modified_ts, reverse=True):
-                count += 1
+            for count, revision in enumerate(self.revisions_additional_approval, start=1):
                 self._format_and_append_revision_to_report(report, revision, count, slack=False)
 
             icon = emoji.emojize(':pray:', use_aliases=True)
             lines.append(f"{icon}{HTML_ICON_SEPARATOR}**{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('need', num_revisions)} additional approvals**: *(newest first)*")
             lines.append('')
-            lines.append('\n'.join(report).encode('utf-8').decode('utf-8'))
+            lines.append('\n'.join(report))
 
         # Revisions Accepted
         num_revisions = len(self.revisions_accepted)
         if num_revisions > 0:
             report = []
-            count = 0
 
-            for revision in sorted(self.revisions_accepted, key=lambda r: r.modified_ts):
-                count += 1
+            for count, revision in enumerate(self.revisions_accepted, start=1):
                 self._format_and_append_revision_to_report(report, revision, count, slack=False)
 
             icon = emoji.emojize(':white_check_mark:', use_aliases=True)
             lines.append(f"{icon}{HTML_ICON_SEPARATOR}**{num_revisions} {pluralize_noun('Diff', num_revisions)} {pluralize_verb('is', num_revisions)} accepted and ready to land**: *(oldest first)*")
             lines.append('')
-            lines.append('\n'.join(report).encode('utf-8').decode('utf-8'))
+            lines.append('\n'.join(report))
 
         text_report = '\n'.join(lines)
         return text_report
@@ -1,5 +1,6 @@
 # Python Standard Library Imports
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 # Phablytics Imports
 from phablytics.reports.base import PhablyticsReport
@@ -42,26 +43,35 @@ class UpcomingProjectTasksDueReport(PhablyticsReport):
 
         self.column_lookup = column_lookup
 
-        def _should_include(task):
-            should_include = (
-                task.id_ not in self.excluded_tasks
-                and not any([
-                    custom_exclusion(task)
-                    for custom_exclusion
-                    in self.custom_exclusions
-                ])
-            )
-            return should_include
+        excluded_tasks = frozenset(self.excluded_tasks)
+        custom_exclusions = self.custom_exclusions
 
-        report_sections = []
-        for column_phid, column in self.column_lookup.items():
+        def _get_column_tasks(column_phid):
             maniphest_tasks = get_maniphest_tasks_by_project_name(
                 self.project_name,
                 column_phids=[column_phid],
                 order=self.order,
             )
+            return maniphest_tasks
+
+        # columns are independent Conduit queries, so fetch them concurrently,
+        # with a small pool to stay polite to the Phabricator instance
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            column_tasks = list(executor.map(_get_column_tasks, self.column_lookup.keys()))
 
-            tasks = filter(_should_include, maniphest_tasks)
+        report_sections = []
+        for (column_phid, column), maniphest_tasks in zip(self.column_lookup.items(), column_tasks):
+            tasks = (
+                task
+                for task
+                in maniphest_tasks
+                if task.id_ not in excluded_tasks
+                and not any(
+                    custom_exclusion(task)
+                    for custom_exclusion
+                    in custom_exclusions
+                )
+            )
 
             report_sections.append(self._ReportSection(
                 column_phid,
@@ -88,19 +98,17 @@ class UpcomingProjectTasksDueReport(PhablyticsReport):
                 task_link = f'<{task.url}|{task.task_id}>'
                 report.append(f'{count}. {task_link}  - _{task.name}_')
 
-            if count > 0:
+            # omit section if no tasks for that section
+            if report:
                 attachments.append({
                     'pretext': f"*{count} {report_section.column.name} {pluralize_noun('Task', count)}*:",
-                    'text': '\n'.join(report).encode('utf-8').decode('utf-8'),
+                    'text': '\n'.join(report),
                     'color': colors[len(attachments) % len(colors)],
                 })
-            else:
-                # omit section if no tasks for that section
-                pass
 
         slack_text = f'*{self.project_name} - {self.HEADING}* _({self.timeline})_'
 
-        if len(attachments) == 0:
+        if not attachments:
             slack_text = '{}\n{}'.format(
                 slack_text,
                 '_All caught up -- there are no tasks for this section._'
@@ -129,11 +137,9 @@ class UpcomingProjectTasksDueReport(PhablyticsReport):
                 task_link = f'[{task.task_id}]({task.url})'
                 report.append(f'{count}. {task_link}  - *{task.name}*')
 
-            if count > 0:
-                lines.append('\n'.join(report).encode('utf-8').decode('utf-8'))
-            else:
-               # omit section if no tasks for that section
-                pass
+            # omit section if no tasks for that section
+            if report:
+                lines.append('\n'.join(report))
 
         text_report = '\n'.join(lines)
         return text_report
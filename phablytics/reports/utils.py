@@ -7,6 +7,7 @@ from dataclasses import (
 )
 
 # Phablytics Imports
+from phablytics.reports.constants import SLACK_MESSAGE_MAX_LENGTH
 from phablytics.settings import (
     REPORTS,
     ReportConfig,
@@ -36,26 +37,13 @@ def get_report_config(report_name, overrides=None):
 
 def get_report_types():
     """Returns a mapping of report types to classes
+
+    The mapping is built lazily, the first time `phablytics.reports.REPORT_TYPES`
+    is accessed, and reused afterwards.
     """
     # Phablytics Imports
-    from phablytics.reports import (
-        GroupReviewStatusReport,
-        NewProjectTasksReport,
-        RecentTasksReport,
-        RevisionStatusReport,
-        UpcomingProjectTasksDueReport,
-        UrgentAndOverdueProjectTasksReport,
-    )
-
-    report_types = {
-        'GroupReviewStatus' : GroupReviewStatusReport,
-        'NewProjectTasks': NewProjectTasksReport,
-        'RecentTasks' : RecentTasksReport,
-        'RevisionStatus' : RevisionStatusReport,
-        'UpcomingProjectTasksDue' : UpcomingProjectTasksDueReport,
-        'UrgentAndOverdueProjectTasks' : UrgentAndOverdueProjectTasksReport,
-    }
-    return report_types
+    from phablytics.reports import REPORT_TYPES
+    return REPORT_TYPES
 
 
 @dataclass
@@ -66,6 +54,62 @@ class SlackMessage:
     emoji: str = None
 
 
+def split_slack_message(message, max_length=SLACK_MESSAGE_MAX_LENGTH):
+    """Splits `message` into one or more `SlackMessage`s of at most
+    `max_length` characters each, so that large reports are not rejected
+
+    Attachments are kept whole where possible; an attachment that is too
+    long on its own is split at line boundaries.
+    """
+    def _new_chunk(text=''):
+        chunk = SlackMessage(
+            text=text,
+            username=message.username,
+            emoji=message.emoji
+        )
+        return chunk
+
+    chunk = _new_chunk(message.text)
+    chunk_length = len(message.text or '')
+
+    for attachment in message.attachments:
+        for part in _split_slack_attachment(attachment, max_length):
+            part_length = len(part.get('pretext', '')) + len(part['text'])
+            if chunk.attachments and chunk_length + part_length > max_length:
+                yield chunk
+                chunk = _new_chunk()
+                chunk_length = 0
+
+            chunk.attachments.append(part)
+            chunk_length += part_length
+
+    yield chunk
+
+
+def _split_slack_attachment(attachment, max_length):
+    """Splits the text of a Slack `attachment` at line boundaries
+
+    Only the first part keeps the attachment's `pretext`.
+    """
+    pretext = attachment.get('pretext', '')
+    if len(pretext) + len(attachment['text']) <= max_length:
+        yield attachment
+    else:
+        lines = []
+        length = len(pretext)
+        for line in attachment['text'].split('\n'):
+            if lines and length + len(line) + 1 > max_length:
+                yield dict(attachment, text='\n'.join(lines))
+                attachment = {k: v for k, v in attachment.items() if k != 'pretext'}
+                lines = []
+                length = 0
+
+            lines.append(line)
+            length += len(line) + 1
+
+        yield dict(attachment, text='\n'.join(lines))
+
+
 def pluralize_noun(noun, count):
     """Adds 's' to `noun` depending on `count`
     """
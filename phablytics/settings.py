@@ -23,6 +23,17 @@ GROUPS = {
 
 REVISION_ACCEPTANCE_THRESHOLD = 2
 
+# How long resolved User and Repo PHIDs are reused before re-querying Conduit
+PHID_LOOKUP_CACHE_TTL_SECONDS = 300  # 5 minutes
+PHID_LOOKUP_CACHE_MAXSIZE = 1024
+
+# Repos rarely change, so resolved Repo PHIDs are also persisted across runs
+PHABLYTICS_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'phablytics'
+)
+REPO_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 1 week
+
 # Reports
 
 
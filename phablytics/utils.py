@@ -5,9 +5,17 @@ from __future__ import absolute_import
 import datetime
 import json
 import os
+import tempfile
+import threading
+import time
 
 # Third Party (PyPI) Imports
+import requests
 from phabricator import Phabricator
+from requests.adapters import (
+    HTTPAdapter,
+    Retry,
+)
 
 # Phablytics Imports
 from phablytics.classes import (
@@ -20,6 +28,12 @@ from phablytics.classes import (
     User,
 )
 from phablytics.constants import MANIPHEST_SUBTYPES
+from phablytics.settings import (
+    PHABLYTICS_CACHE_DIR,
+    PHID_LOOKUP_CACHE_MAXSIZE,
+    PHID_LOOKUP_CACHE_TTL_SECONDS,
+    REPO_CACHE_TTL_SECONDS,
+)
 
 
 ##
@@ -28,6 +42,32 @@ from phablytics.constants import MANIPHEST_SUBTYPES
 
 PHAB = Phabricator()
 
+# Shared HTTP session for all Conduit calls.
+# The Phabricator client otherwise opens a new session (and connection,
+# including the TLS handshake) for every method call.
+CONDUIT_SESSION = requests.Session()
+CONDUIT_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    # same retry policy as the Phabricator client's own sessions
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        allowed_methods=['HEAD', 'GET', 'POST', 'PATCH', 'PUT', 'OPTIONS']
+    )
+)
+CONDUIT_SESSION.mount('https://', CONDUIT_HTTP_ADAPTER)
+CONDUIT_SESSION.mount('http://', CONDUIT_HTTP_ADAPTER)
+
+
+def call_conduit(method, **kwargs):
+    """Calls the Conduit `method` (e.g. `PHAB.user.whoami`) using
+    pooled keep-alive connections from `CONDUIT_SESSION`
+    """
+    method.session = CONDUIT_SESSION
+    results = method(**kwargs)
+    return results
+
 
 def update_interfaces():
     PHAB.update_interfaces()
@@ -45,7 +85,7 @@ def get_phids(phids, as_object=PhabricatorEntity):
     """
     phids = list(set(phids))  # dedup PHIDs
 
-    results = PHAB.phid.query(phids=phids)
+    results = call_conduit(PHAB.phid.query, phids=phids)
 
     phid_objects_lookup = {
         phid: as_object(results[phid])
@@ -56,6 +96,73 @@ def get_phids(phids, as_object=PhabricatorEntity):
     return phid_objects_lookup
 
 
+# (as_object, phid) -> (expires_at, object)
+# Entries all share one TTL and are (re-)inserted at the end, so insertion
+# order is also expiry order: the oldest entries are always first.
+PHID_LOOKUP_CACHE = {}
+PHID_LOOKUP_CACHE_LOCK = threading.Lock()
+
+
+def get_phids_cached(phids, as_object=PhabricatorEntity):
+    """Retrieve objects for arbitrary PHIDs, reusing recent results.
+
+    Only PHIDs that are not already cached (or whose cache entry has
+    expired after `PHID_LOOKUP_CACHE_TTL_SECONDS`) are queried. The cache
+    holds at most `PHID_LOOKUP_CACHE_MAXSIZE` entries, evicting the oldest.
+    """
+    now = time.monotonic()
+
+    phid_objects_lookup = {}
+    missing_phids = []
+
+    with PHID_LOOKUP_CACHE_LOCK:
+        for phid in set(phids):
+            key = (as_object, phid)
+            cached = PHID_LOOKUP_CACHE.get(key)
+            if cached and cached[0] > now:
+                phid_objects_lookup[phid] = cached[1]
+            else:
+                if cached:
+                    del PHID_LOOKUP_CACHE[key]
+                missing_phids.append(phid)
+
+    if missing_phids:
+        results = get_phids(missing_phids, as_object=as_object)
+        expires_at = now + PHID_LOOKUP_CACHE_TTL_SECONDS
+
+        with PHID_LOOKUP_CACHE_LOCK:
+            for phid, phid_object in results.items():
+                key = (as_object, phid)
+                # re-insert at the end, keeping insertion order == expiry order
+                PHID_LOOKUP_CACHE.pop(key, None)
+                PHID_LOOKUP_CACHE[key] = (expires_at, phid_object)
+
+            _prune_phid_lookup_cache(now)
+
+        phid_objects_lookup.update(results)
+
+    return phid_objects_lookup
+
+
+def _prune_phid_lookup_cache(now):
+    """Drops expired entries, then the oldest entries past the size limit
+
+    Callers must hold `PHID_LOOKUP_CACHE_LOCK`.
+    """
+    stale_keys = []
+    num_to_evict = len(PHID_LOOKUP_CACHE) - PHID_LOOKUP_CACHE_MAXSIZE
+
+    for key, (expires_at, phid_object) in PHID_LOOKUP_CACHE.items():
+        if expires_at <= now or len(stale_keys) < num_to_evict:
+            stale_keys.append(key)
+        else:
+            # everything after this entry is newer
+            break
+
+    for key in stale_keys:
+        del PHID_LOOKUP_CACHE[key]
+
+
 ##
 # Adhoc
 
@@ -78,7 +185,7 @@ def adhoc(method_path, method_args=None):
     else:
         kwargs = {}
 
-    results = f(**kwargs)
+    results = call_conduit(f, **kwargs)
     response = results.response
     return response
 
@@ -116,13 +223,29 @@ def fetch_differential_revisions(
     if modified_before_dt:
         constraints['modifiedEnd'] = int(modified_before_dt.timestamp())
 
-    results = PHAB.differential.revision.search(
-        queryKey=query_key,
-        constraints=constraints,
-        attachments={'reviewers': True}
-    )
+    revisions = []
+    has_more_results = True
+    after = None
+
+    while has_more_results:
+        # handle pagination, since limits are 100 at a time
+        results = call_conduit(
+            PHAB.differential.revision.search,
+            queryKey=query_key,
+            constraints=constraints,
+            attachments={'reviewers': True},
+            after=after
+        )
+
+        cursor = results.get('cursor', {})
+        after = cursor.get('after', None)
+        has_more_results = after is not None
 
-    revisions = [Revision(revision_data) for revision_data in results.data]
+        revisions.extend([
+            Revision(revision_data)
+            for revision_data
+            in results.data
+        ])
 
     return revisions
 
@@ -146,7 +269,8 @@ def get_maniphest_tasks(constraints, order=None):
 
     while has_more_results:
         # handle pagination, since limits are 100 at a time
-        results = PHAB.maniphest.search(
+        results = call_conduit(
+            PHAB.maniphest.search,
             constraints=constraints,
             order=order,
             after=after
@@ -260,7 +384,7 @@ def get_project_by_name(project_name, include_members=False):
     attachments = {}
     if include_members:
         attachments['members'] = True
-    results = PHAB.project.search(constraints=constraints, attachments=attachments)
+    results = call_conduit(PHAB.project.search, constraints=constraints, attachments=attachments)
 
     projects = [
         Project(project_data)
@@ -301,7 +425,7 @@ def get_project_columns_by_project_name(project_name, column_names=None):
             project.phid,
         ],
     }
-    results = PHAB.project.column.search(constraints=constraints)
+    results = call_conduit(PHAB.project.column.search, constraints=constraints)
     project_columns = [
         ProjectColumn(column_data)
         for column_data
@@ -317,13 +441,95 @@ def get_project_columns_by_project_name(project_name, column_names=None):
 # Repos
 
 
+REPO_CACHE_FILENAME = os.path.join(PHABLYTICS_CACHE_DIR, 'repos.json')
+
+
 def get_repos_by_phid(phids):
     """Get repos mapping by PHID
+
+    Repos are persisted on disk in `REPO_CACHE_FILENAME` for
+    `REPO_CACHE_TTL_SECONDS`, so only repos not seen recently are queried.
     """
-    repos_lookup = get_phids(phids, as_object=Repo)
+    now = time.time()
+    repo_cache = _load_repo_cache(now)
+
+    repos_lookup = {}
+    missing_phids = []
+
+    for phid in set(phids):
+        if phid in repo_cache:
+            repos_lookup[phid] = Repo(repo_cache[phid]['raw_data'])
+        else:
+            missing_phids.append(phid)
+
+    if missing_phids:
+        missing_repos_lookup = get_phids_cached(missing_phids, as_object=Repo)
+        for phid, repo in missing_repos_lookup.items():
+            repo_cache[phid] = {
+                'cached_at': now,
+                'raw_data': repo.raw_data,
+            }
+
+        repos_lookup.update(missing_repos_lookup)
+        _save_repo_cache(repo_cache)
+
     return repos_lookup
 
 
+def _load_repo_cache(now):
+    """Loads unexpired entries of the on-disk repo cache
+    """
+    try:
+        with open(REPO_CACHE_FILENAME, 'r') as f:
+            repo_cache = json.load(f)
+    except (OSError, ValueError):
+        # missing or corrupt cache file; start over
+        repo_cache = {}
+
+    if not (
+        isinstance(repo_cache, dict)
+        and all(isinstance(entry, dict) for entry in repo_cache.values())
+    ):
+        # valid JSON, but not a cache written by Phablytics; start over
+        repo_cache = {}
+
+    repo_cache = {
+        phid: entry
+        for phid, entry
+        in repo_cache.items()
+        if (
+            isinstance(entry.get('cached_at'), (int, float))
+            and isinstance(entry.get('raw_data'), dict)
+            and now - entry['cached_at'] < REPO_CACHE_TTL_SECONDS
+        )
+    }
+    return repo_cache
+
+
+def _save_repo_cache(repo_cache):
+    """Saves the repo cache to disk
+
+    The cache is only an optimization, so failing to write it is not an error.
+    """
+    tmp_filename = None
+    try:
+        os.makedirs(PHABLYTICS_CACHE_DIR, exist_ok=True)
+        # unique per call, so concurrent writers (processes or threads)
+        # never share a temp file
+        fd, tmp_filename = tempfile.mkstemp(dir=PHABLYTICS_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(repo_cache, f)
+        # atomic, so readers never see a partially written file
+        os.replace(tmp_filename, REPO_CACHE_FILENAME)
+    except OSError:
+        if tmp_filename:
+            # clean up the temp file; it may already be gone
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+
+
 ##
 # Users
 
@@ -332,7 +538,8 @@ def get_users_by_username(usernames):
     constraints = {
         'usernames': usernames,
     }
-    results = PHAB.user.search(
+    results = call_conduit(
+        PHAB.user.search,
         constraints=constraints
     )
     users = [
@@ -347,7 +554,7 @@ def get_users_by_username(usernames):
 def get_users_by_phid(phids):
     """Get users mapping by PHID
     """
-    users_lookup = get_phids(phids, as_object=User)
+    users_lookup = get_phids_cached(phids, as_object=User)
     return users_lookup
 
 
@@ -356,7 +563,7 @@ def whoami():
 
     https://secure.phabricator.com/conduit/method/user.whoami/
     """
-    results = PHAB.user.whoami()
+    results = call_conduit(PHAB.user.whoami)
     user = User(results.response)
     return user
 